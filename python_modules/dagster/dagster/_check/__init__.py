@@ -1051,6 +1051,9 @@ def opt_numeric_param(
 def path_param(
     obj: Union[str, PathLike], param_name: str, additional_message: Optional[str] = None
 ) -> str:
+    # plain strings are already normalized, skip the isinstance check and fspath call
+    if type(obj) is str:
+        return obj
     if not isinstance(obj, (str, PathLike)):
         raise _param_type_mismatch_exception(obj, (str, PathLike), param_name, additional_message)
     return fspath(obj)
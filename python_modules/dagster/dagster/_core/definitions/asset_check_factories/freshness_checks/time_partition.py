@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, Sequence, Union
+from typing import Dict, Iterable, Sequence, Union
 
 import pendulum
 
@@ -136,29 +136,36 @@ def _build_freshness_multi_check(
     timezone: str,
     severity: AssetCheckSeverity,
 ) -> AssetChecksDefinition:
-    params_metadata: dict[str, Any] = {
-        TIMEZONE_PARAM_KEY: timezone,
-        DEADLINE_CRON_PARAM_KEY: deadline_cron,
-    }
-
-    @freshness_multi_asset_check(
-        params_metadata=JsonMetadataValue(params_metadata), asset_keys=asset_keys
+    params_metadata = JsonMetadataValue(
+        {
+            TIMEZONE_PARAM_KEY: timezone,
+            DEADLINE_CRON_PARAM_KEY: deadline_cron,
+        }
     )
+
+    @freshness_multi_asset_check(params_metadata=params_metadata, asset_keys=asset_keys)
     def the_check(context: AssetCheckExecutionContext) -> Iterable[AssetCheckResult]:
+        # The deadline only depends on the current time and the check params, so it is shared by
+        # every selected check in this execution.
+        current_timestamp = pendulum.now("UTC").timestamp()
+        current_time_in_freshness_tz = pendulum.from_timestamp(current_timestamp, tz=timezone)
+        deadline = get_latest_completed_cron_tick(
+            deadline_cron, current_time_in_freshness_tz, timezone
+        )
+        deadline_timestamp = deadline.timestamp()
+        fresh_until_timestamp = get_next_cron_tick(
+            deadline_cron, current_time_in_freshness_tz, timezone
+        ).timestamp()
+
+        asset_graph = context.job_def.asset_layer.asset_graph
         for check_key in context.selected_asset_check_keys:
             asset_key = check_key.asset_key
-            current_timestamp = pendulum.now("UTC").timestamp()
 
             partitions_def = check.inst(
-                context.job_def.asset_layer.asset_graph.get(asset_key).partitions_def,
-                TimeWindowPartitionsDefinition,
-            )
-            current_time_in_freshness_tz = pendulum.from_timestamp(current_timestamp, tz=timezone)
-            deadline = get_latest_completed_cron_tick(
-                deadline_cron, current_time_in_freshness_tz, timezone
+                asset_graph.get(asset_key).partitions_def, TimeWindowPartitionsDefinition
             )
             deadline_in_partitions_def_tz = pendulum.from_timestamp(
-                deadline.timestamp(), tz=partitions_def.timezone
+                deadline_timestamp, tz=partitions_def.timezone
             )
             last_completed_time_window = check.not_none(
                 partitions_def.get_prev_partition_window(deadline_in_partitions_def_tz)
@@ -172,14 +179,20 @@ def the_check(context: AssetCheckExecutionContext) -> Iterable[AssetCheckResult]
             passed = latest_record is not None
 
             metadata: Dict[str, MetadataValue] = {
-                FRESHNESS_PARAMS_METADATA_KEY: JsonMetadataValue(params_metadata),
-                LATEST_CRON_TICK_METADATA_KEY: TimestampMetadataValue(deadline.timestamp()),
+                FRESHNESS_PARAMS_METADATA_KEY: params_metadata,
+                LATEST_CRON_TICK_METADATA_KEY: TimestampMetadataValue(deadline_timestamp),
             }
 
             # Allows us to distinguish between the case where the asset has never been
-            # observed/materialized, and the case where this partition in particular is missing
-            latest_record_any_partition = retrieve_latest_record(
-                instance=context.instance, asset_key=asset_key, partition_key=None
+            # observed/materialized, and the case where this partition in particular is missing.
+            # If the expected partition has a record, then the asset has trivially been updated
+            # before, so we only need to query the event log again when the check fails.
+            latest_record_any_partition = (
+                latest_record
+                if passed
+                else retrieve_latest_record(
+                    instance=context.instance, asset_key=asset_key, partition_key=None
+                )
             )
 
             if not passed and latest_record_any_partition is not None:
@@ -189,11 +202,7 @@ def the_check(context: AssetCheckExecutionContext) -> Iterable[AssetCheckResult]
                     check.not_none(get_last_updated_timestamp(latest_record_any_partition, context))
                 )
             elif passed:
-                metadata[FRESH_UNTIL_METADATA_KEY] = TimestampMetadataValue(
-                    get_next_cron_tick(
-                        deadline_cron, current_time_in_freshness_tz, timezone
-                    ).timestamp()
-                )
+                metadata[FRESH_UNTIL_METADATA_KEY] = TimestampMetadataValue(fresh_until_timestamp)
 
             yield AssetCheckResult(
                 passed=passed,
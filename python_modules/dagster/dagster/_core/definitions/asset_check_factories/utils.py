@@ -239,10 +239,8 @@ def unique_id_from_asset_keys(asset_keys: Sequence[AssetKey]) -> str:
     This is necessary to disambiguate between different ops underlying freshness checks without
     forcing the user to provide a name for the underlying op.
     """
-    sorted_asset_keys = sorted(asset_keys, key=lambda asset_key: asset_key.to_string())
-    return non_secure_md5_hash_str(
-        ",".join([str(asset_key) for asset_key in sorted_asset_keys]).encode()
-    )[:8]
+    sorted_asset_keys = sorted(asset_keys, key=AssetKey.to_string)
+    return non_secure_md5_hash_str(",".join(map(str, sorted_asset_keys)).encode())[:8]
 
 
 def freshness_multi_asset_check(params_metadata: JsonMetadataValue, asset_keys: Sequence[AssetKey]):
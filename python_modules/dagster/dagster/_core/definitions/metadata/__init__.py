@@ -2,6 +2,7 @@
 from datetime import datetime
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
     List,
@@ -131,8 +132,24 @@ def has_corresponding_metadata_value_class(obj: Any) -> bool:
     return isinstance(obj, (str, float, bool, int, list, dict, os.PathLike, AssetKey, TableSchema))
 
 
+# Raw value types that map to a single MetadataValue constructor. Lookups use the exact type of the
+# raw value, so instances of subclasses (e.g. of str or dict) fall through to the isinstance checks
+# in normalize_metadata_value.
+_METADATA_VALUE_CONSTRUCTORS_BY_RAW_TYPE: Mapping[type, Callable[[Any], "MetadataValue[Any]"]] = {
+    str: MetadataValue.text,
+    float: MetadataValue.float,
+    bool: MetadataValue.bool,
+    int: MetadataValue.int,
+    list: MetadataValue.json,
+    dict: MetadataValue.json,
+}
+
+
 def normalize_metadata_value(raw_value: RawMetadataValue) -> "MetadataValue[Any]":
-    if isinstance(raw_value, MetadataValue):
+    constructor = _METADATA_VALUE_CONSTRUCTORS_BY_RAW_TYPE.get(type(raw_value))
+    if constructor is not None:
+        return constructor(raw_value)
+    elif isinstance(raw_value, MetadataValue):
         return raw_value
     elif isinstance(raw_value, str):
         return MetadataValue.text(raw_value)
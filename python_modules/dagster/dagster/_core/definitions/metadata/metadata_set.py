@@ -1,4 +1,4 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from functools import lru_cache
 from typing import AbstractSet, Any, Mapping, Optional, Type
 
@@ -15,24 +15,24 @@
 
 
 # Python types that have a MetadataValue types that directly wraps them
-DIRECTLY_WRAPPED_METADATA_TYPES = {
-    str,
-    float,
-    int,
-    bool,
-    TableSchema,
-    TableColumnLineage,
-    type(None),
-}
-
-T_NamespacedMetadataSet = TypeVar("T_NamespacedMetadataSet", bound="NamespacedMetadataSet")
+DIRECTLY_WRAPPED_METADATA_TYPES = frozenset(
+    {
+        str,
+        float,
+        int,
+        bool,
+        TableSchema,
+        TableColumnLineage,
+        type(None),
+    }
+)
 
 
 def is_raw_metadata_type(t: Type) -> bool:
-    return issubclass(t, MetadataValue) or t in DIRECTLY_WRAPPED_METADATA_TYPES
+    return t in DIRECTLY_WRAPPED_METADATA_TYPES or issubclass(t, MetadataValue)
 
 
-class NamespacedMetadataSet(ABC, DagsterModel):
+class NamespacedMetadataSet(DagsterModel):
     """Extend this class to define a set of metadata fields in the same namespace.
 
     Supports splatting to a dictionary that can be placed inside a metadata argument along with
@@ -45,8 +45,14 @@ class NamespacedMetadataSet(ABC, DagsterModel):
     """
 
     def __init__(self, *args, **kwargs):
-        for field_name in model_fields(self).keys():
-            annotation_types = self._get_accepted_types_for_field(field_name)
+        self._validate_field_annotations()
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    @lru_cache(maxsize=None)  # the annotations are fixed for a given class, so only check them once
+    def _validate_field_annotations(cls) -> None:
+        for field_name in model_fields(cls).keys():
+            annotation_types = cls._get_accepted_types_for_field(field_name)
             invalid_annotation_types = {
                 annotation_type
                 for annotation_type in annotation_types
@@ -56,7 +62,6 @@ def __init__(self, *args, **kwargs):
                 check.failed(
                     f"Type annotation for field '{field_name}' includes invalid metadata type(s): {invalid_annotation_types}"
                 )
-        super().__init__(*args, **kwargs)
 
     @classmethod
     @abstractmethod
@@ -67,21 +72,30 @@ def namespace(cls) -> str:
     def _namespaced_key(cls, key: str) -> str:
         return f"{cls.namespace()}/{key}"
 
-    @staticmethod
-    def _strip_namespace_from_key(key: str) -> str:
-        return key.split("/", 1)[1]
+    @classmethod
+    @lru_cache(maxsize=None)  # the namespace and fields are fixed for a given class
+    def _namespaced_keys_by_field_name(cls) -> Mapping[str, str]:
+        return {field_name: cls._namespaced_key(field_name) for field_name in model_fields(cls)}
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _field_names_by_namespaced_key(cls) -> Mapping[str, str]:
+        return {
+            namespaced_key: field_name
+            for field_name, namespaced_key in cls._namespaced_keys_by_field_name().items()
+        }
 
     def keys(self) -> AbstractSet[str]:
         return {
-            self._namespaced_key(key)
-            for key in model_fields(self).keys()
+            namespaced_key
+            for field_name, namespaced_key in self._namespaced_keys_by_field_name().items()
             # getattr returns the pydantic property on the subclass
-            if getattr(self, key) is not None
+            if getattr(self, field_name) is not None
         }
 
     def __getitem__(self, key: str) -> Any:
         # getattr returns the pydantic property on the subclass
-        return getattr(self, self._strip_namespace_from_key(key))
+        return getattr(self, self._field_names_by_namespaced_key()[key])
 
     @classmethod
     def extract(
@@ -105,13 +119,13 @@ class MyMetadataSet(NamedspacedMetadataSet):
         Args:
             metadata (Mapping[str, Any]): A dictionary of metadata entries.
         """
+        field_names_by_namespaced_key = cls._field_names_by_namespaced_key()
         kwargs = {}
-        for namespaced_key, value in metadata.items():
-            splits = namespaced_key.split("/")
-            if len(splits) == 2:
-                namespace, key = splits
-                if namespace == cls.namespace() and key in model_fields(cls):
-                    kwargs[key] = cls._extract_value(field_name=key, value=value)
+        for namespaced_key in metadata.keys() & field_names_by_namespaced_key.keys():
+            field_name = field_names_by_namespaced_key[namespaced_key]
+            kwargs[field_name] = cls._extract_value(
+                field_name=field_name, value=metadata[namespaced_key]
+            )
 
         return cls(**kwargs)
 
@@ -123,8 +137,7 @@ def _extract_value(cls, field_name: str, value: Any) -> Any:
         the MetadataSet using the inner float.
         """
         if isinstance(value, MetadataValue):
-            annotation = model_fields(cls)[field_name].annotation
-            annotation_acceptable_types = flatten_unions(annotation)
+            annotation_acceptable_types = cls._get_accepted_types_for_field(field_name)
             if (
                 type(value) not in annotation_acceptable_types
                 and type(value.value) in annotation_acceptable_types
@@ -1,6 +1,7 @@
 import os
 from abc import ABC, abstractmethod
 from datetime import datetime
+from itertools import islice
 from typing import (
     Any,
     Callable,
@@ -20,6 +21,7 @@
 from dagster._core.definitions.asset_key import AssetKey
 from dagster._core.errors import DagsterInvalidMetadata
 from dagster._model import DagsterModel
+from dagster._model.pydantic_compat_layer import InstanceOf
 from dagster._serdes import whitelist_for_serdes
 from dagster._serdes.serdes import (
     PackableValue,
@@ -308,6 +310,10 @@ def emit_metadata(context, df):
         Args:
             value (bool): The bool value for a metadata entry.
         """
+        if value is True:
+            return _TRUE_METADATA_VALUE
+        elif value is False:
+            return _FALSE_METADATA_VALUE
         return BoolMetadataValue(value)
 
     @public
@@ -318,12 +324,15 @@ def timestamp(value: Union["float", datetime]) -> "TimestampMetadataValue":
         parameter for supported events.
 
         Args:
-            value (Union[float, datetime]): The unix timestamp value for a metadata entry. If a
-                datetime is provided, the timestamp will be extracted. datetimes without timezones
-                are not accepted, because their timestamps can be ambiguous.
+            value (Union[float, datetime]): The unix timestamp value for a metadata entry. An int
+                is accepted and converted to a float. If a datetime is provided, the timestamp will
+                be extracted. datetimes without timezones are not accepted, because their
+                timestamps can be ambiguous.
         """
         if isinstance(value, float):
             return TimestampMetadataValue(value)
+        elif isinstance(value, int) and not isinstance(value, bool):
+            return TimestampMetadataValue(float(value))
         elif isinstance(value, datetime):
             if value.tzinfo is None:
                 check.failed(
@@ -493,7 +502,7 @@ def null() -> "NullMetadataValue":
         """Static constructor for a metadata value representing null. Can be used as the value type
         for the `metadata` parameter for supported events.
         """
-        return NullMetadataValue()
+        return _NULL_METADATA_VALUE
 
 
 # ########################
@@ -874,15 +883,17 @@ def __init__(self, records: Sequence[TableRecord], schema: Optional[TableSchema]
         if len(records) == 0:
             schema = check.not_none(schema, "schema must be provided if records is empty")
         else:
-            columns = set(records[0].data.keys())
-            for record in records[1:]:
+            # keys views compare as sets without copying the keys of each record
+            first_record_data = records[0].data
+            columns = first_record_data.keys()
+            for record in islice(records, 1, None):
                 check.invariant(
-                    set(record.data.keys()) == columns, "All records must have the same fields"
+                    record.data.keys() == columns, "All records must have the same fields"
                 )
             schema = schema or TableSchema(
                 columns=[
                     TableColumn(name=k, type=TableMetadataValue.infer_column_type(v))
-                    for k, v in records[0].data.items()
+                    for k, v in first_record_data.items()
                 ]
             )
 
@@ -934,7 +945,8 @@ class TableColumnLineageMetadataValue(DagsterModel, MetadataValue[TableColumnLin
             for the table.
     """
 
-    column_lineage_inner: TableColumnLineage = Field(..., alias="column_lineage")
+    # validated with isinstance, since pydantic would otherwise rebuild the whole lineage tree
+    column_lineage_inner: InstanceOf[TableColumnLineage] = Field(..., alias="column_lineage")
 
     def __init__(self, column_lineage: TableColumnLineage):
         super().__init__(column_lineage=column_lineage)
@@ -955,3 +967,10 @@ class NullMetadataValue(DagsterModel, MetadataValue[None]):
     def value(self) -> None:
         """None: The wrapped null value."""
         return None
+
+
+# Metadata values are immutable, so the static constructors can hand out shared instances for the
+# values that can only take a handful of forms.
+_NULL_METADATA_VALUE = NullMetadataValue()
+_TRUE_METADATA_VALUE = BoolMetadataValue(True)
+_FALSE_METADATA_VALUE = BoolMetadataValue(False)
@@ -141,3 +141,19 @@ def _decorate(func):
 
 
 compat_model_validator = model_validator
+
+
+try:
+    # Pydantic 2.x
+    from pydantic import InstanceOf as InstanceOf  # type: ignore
+except ImportError:
+    # Pydantic 1.x
+
+    class InstanceOf:
+        """Mimics the Pydantic 2.x InstanceOf annotation, which validates a field with an
+        isinstance check instead of rebuilding the value from its fields. Pydantic 1.x has no
+        equivalent, so the annotated type is used as-is.
+        """
+
+        def __class_getitem__(cls, item):
+            return item
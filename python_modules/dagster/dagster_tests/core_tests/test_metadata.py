@@ -1,10 +1,12 @@
 from dagster import (
     AssetKey,
+    BoolMetadataValue,
     GraphDefinition,
     IntMetadataValue,
     JsonMetadataValue,
     MetadataValue,
     NodeInvocation,
+    NullMetadataValue,
     TableColumn,
     TableColumnDep,
     TableColumnLineage,
@@ -77,6 +79,17 @@ def test_int_metadata_value():
     assert IntMetadataValue(value=5).value == 5
 
 
+def test_bool_and_null_metadata_values():
+    assert MetadataValue.bool(True) == BoolMetadataValue(True)
+    assert MetadataValue.bool(True) is MetadataValue.bool(True)
+    assert MetadataValue.bool(False) == BoolMetadataValue(False)
+    assert MetadataValue.bool(False) is MetadataValue.bool(False)
+    assert MetadataValue.bool(False).value is False
+    assert MetadataValue.null() == NullMetadataValue()
+    assert MetadataValue.null() is MetadataValue.null()
+    assert deserialize_value(serialize_value(MetadataValue.null())) == MetadataValue.null()
+
+
 def test_url_metadata_value():
     url = "http://dagster.io"
     assert UrlMetadataValue(url).value == url
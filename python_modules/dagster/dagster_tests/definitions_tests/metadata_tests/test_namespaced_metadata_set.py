@@ -71,3 +71,25 @@ def namespace(cls) -> str:
         match=r"Type annotation for field 'unsupported' includes invalid metadata type\(s\).+MyClass",
     ):
         MyMetadataSet(unsupported=MyClass())
+
+
+def test_extract_ignores_other_keys():
+    class MyMetadataSet(NamespacedMetadataSet):
+        primitive_int: Optional[int] = None
+        primitive_str: Optional[str] = None
+
+        @classmethod
+        def namespace(cls) -> str:
+            return "foo"
+
+    metadata_set = MyMetadataSet.extract(
+        {
+            "foo/primitive_int": 5,
+            "bar/primitive_str": "bar",
+            "foo/unknown_field": "baz",
+            "primitive_str": "qux",
+            "foo/primitive_int/nested": 6,
+        }
+    )
+    assert metadata_set == MyMetadataSet(primitive_int=5)
+    assert dict(metadata_set) == {"foo/primitive_int": 5}
@@ -163,6 +163,13 @@ def test_metadata_value_timestamp():
     ):
         MetadataValue.timestamp(normal_dt_without_timezone)
 
+    int_metadata_value = MetadataValue.timestamp(1709726400)
+    assert int_metadata_value == MetadataValue.timestamp(1709726400.0)
+    assert isinstance(int_metadata_value.value, float)
+
+    with pytest.raises(CheckError, match="Expected either a float or a datetime"):
+        MetadataValue.timestamp(True)  # type: ignore
+
 
 def test_unknown_metadata_value():
     @op(out={})
@@ -186,6 +193,13 @@ def the_job():
     )
 
 
+def test_column_lineage_metadata_value_keeps_lineage_instance():
+    lineage = TableColumnLineage(
+        {"foo": [TableColumnDep(asset_key=AssetKey("bar"), column_name="baz")]}
+    )
+    assert MetadataValue.column_lineage(lineage).value is lineage
+
+
 def test_parse_null_metadata():
     metadata = {"foo": None}
     normalized = normalize_metadata(metadata)
@@ -214,6 +228,20 @@ def test_parse_path_metadata():
     assert normalized["path"] == PathMetadataValue("/a/b.csv")
 
 
+def test_parse_primitive_metadata():
+    class MyStr(str):
+        pass
+
+    normalized = normalize_metadata(
+        {"str": "foo", "my_str": MyStr("bar"), "bool": True, "int": 1, "dict": {"a": 1}}
+    )
+    assert normalized["str"] == TextMetadataValue("foo")
+    assert normalized["my_str"] == TextMetadataValue("bar")
+    assert normalized["bool"] == BoolMetadataValue(True)
+    assert normalized["int"] == IntMetadataValue(1)
+    assert normalized["dict"] == JsonMetadataValue({"a": 1})
+
+
 def test_bad_json_metadata_value():
     @op(out={})
     def the_op(context):